@@ -32,6 +32,8 @@ parser.add_argument("--seed",             type=int, default=42,
                     help="global RNG seed")
 parser.add_argument("--verbose",          type=int, default=1,
                     help="Level of logging info output, 0 for silence mode; 1 for detailed mode")
+parser.add_argument("--headless",         action="store_true",
+                    help="disable rendering and per-step delay (e.g. for benchmarking)")
 # --- env / sensor ----------------------------------------------------------- #
 parser.add_argument("--beta",             type=float, default=1.0,
                     help="β for ExponentialSensorModel")
@@ -101,7 +103,7 @@ if __name__ == "__main__":
     device = torch.device("cuda:0" if torch.cuda.is_available() else "cpu")
     env_kwargs = {
         "id": "DrivingContinuousRandom-v0",
-        "render_mode": "human",
+        "render_mode": None if args.headless else "human",
         "obstacle_density": args.obstacle_density,
         "obstacle_radius_range": (0.4, 0.8),
         "random_seed": args.seed if args.deterministic else None,
@@ -182,8 +184,10 @@ if __name__ == "__main__":
         step_result = env.step(actions)
         obs, rewards, terminations, truncations, _, infos = step_result
 
-        env.render()
+        if not args.headless:
+            env.render()
         if terminations["0"] or truncations["0"]:
             break
-        time.sleep(0.05)
+        if not args.headless:
+            time.sleep(0.05)
     env.close()
\ No newline at end of file
@@ -31,21 +31,18 @@ def run_environment(
     # Reset the environment
     obs, info = env.reset()
     
+    # Agents and their action spaces are fixed for the environment, so look up the
+    # action samplers once rather than every step
+    samplers = {agent: env.action_spaces[agent].sample for agent in env.agents}
+    
     # Run for specified number of steps
     for i in range(num_steps):
         # Sample random actions for all agents
-        actions = {agent: env.action_spaces[agent].sample() for agent in env.agents}
+        actions = {agent: sample() for agent, sample in samplers.items()}
         
         # Step the environment
-        step_result = env.step(actions)
-        
-        # Unpack the step result based on its structure
-        if isinstance(step_result, tuple) and len(step_result) == 6:
-            # Format: (obs, rewards, terminations, truncations, done, infos)
-            next_obs, rewards, terminations, truncations, _, infos = step_result
-        else:
-            # Standard format: (obs, rewards, terminations, truncations, infos)
-            next_obs, rewards, terminations, truncations, infos = step_result
+        # Format: (obs, rewards, terminations, truncations, done, infos)
+        next_obs, rewards, terminations, truncations, _, infos = env.step(actions)
         
         # Print some information (only every 50 steps to avoid too much output)
         if i % 50 == 0:
@@ -8,14 +8,13 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from itertools import product
 from queue import PriorityQueue
-from typing import Dict, Iterable, List, NamedTuple, Set, Tuple, Union
+from typing import Dict, Iterable, List, NamedTuple, Sequence, Set, Tuple, Union
 
 import numpy as np
 from gymnasium import spaces
 
 from posggym.error import DependencyNotInstalled
 
-
 try:
     import pymunk
     from pymunk import Vec2d
@@ -309,6 +308,48 @@ class AbstractContinuousWorld(ABC):
         body.velocity = Vec2d(state[3], state[4])
         body.angular_velocity = state[5]
 
+    def get_entity_states(
+        self, ids: Sequence[str], out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Get underlying state of multiple entities in the world.
+
+        Returns 2D array with shape `(len(ids), 6)`, with each row ordered the same as
+        the PMBodyState namedtuple. If `out` is provided, states are written into it.
+        """
+        if out is None:
+            out = np.empty((len(ids), PMBodyState.num_features()), dtype=np.float32)
+        for i, id in enumerate(ids):
+            body, _ = self.entities[id]
+            x, y = body.position
+            vx, vy = body.velocity
+            out[i] = (x, y, body.angle, vx, vy, body.angular_velocity)
+        return out
+
+    def set_entity_states(self, ids: Sequence[str], states: np.ndarray):
+        """Set the state of multiple entities.
+
+        `states` should be 2D array with shape `(len(ids), 6)`, with each row ordered
+        the same as the PMBodyState namedtuple.
+        """
+        for id, (x, y, angle, vx, vy, vangle) in zip(ids, states.tolist()):
+            body, _ = self.entities[id]
+            body.position = Vec2d(x, y)
+            body.angle = angle
+            body.velocity = Vec2d(vx, vy)
+            body.angular_velocity = vangle
+
+    def sync_entity_shapes(self, ids: Sequence[str]):
+        """Update cached shape positions of entities to match their body states.
+
+        Changes made with `set_entity_state(s)` only update the pymunk bodies, and are
+        otherwise propagated to their shapes (e.g. for `space.debug_draw`) when the
+        space is next stepped. This updates the shapes directly, without running the
+        simulation.
+        """
+        for id in ids:
+            body, _ = self.entities[id]
+            self.space.reindex_shapes_for_body(body)
+
     def update_entity_state(
         self,
         id: str,
@@ -340,6 +381,16 @@ class AbstractContinuousWorld(ABC):
         """Get  (min x, max_x), (min y, max y) bounds of the world."""
         return (0, self.size), (0, self.size)
 
+    def get_block_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get (x, y) center and radius of each block in the world.
+
+        Returns arrays with shapes `(n_blocks, 2)` and `(n_blocks,)`. Subclasses whose
+        blocks never change can override this to return precomputed arrays.
+        """
+        block_array = np.array([[pos[0], pos[1]] for pos, _ in self.blocks])
+        radii = np.array([s for _, s in self.blocks])
+        return block_array.reshape(-1, 2), radii
+
     @property
     def blocked_coords(self) -> Set[Coord]:
         """The set of all integer coordinates that contain at least part of a block."""
@@ -349,12 +400,15 @@ class AbstractContinuousWorld(ABC):
             offset = 0.5
             # to handle any weird rounding
             max_coord = math.ceil(round(self.size, 6))
+            # (x, y, squared overlap distance) for each block, so cells can be checked
+            # using squared distances, without sqrt or method call overhead
+            blocks = [(pos[0], pos[1], (offset + r) ** 2) for pos, r in self.blocks]
             for x, y in product(list(range(max_coord)), repeat=2):
-                offset_coord = (x + offset, y + offset)
+                cx, cy = x + offset, y + offset
 
                 # check if cell contains any block
-                for pos, r in self.blocks:
-                    if self.euclidean_dist(offset_coord, pos) < (offset + r):
+                for bx, by, overlap_dist_sq in blocks:
+                    if (cx - bx) ** 2 + (cy - by) ** 2 < overlap_dist_sq:
                         self._blocked_coords.add((x, y))
                         break
 
@@ -652,8 +706,7 @@ class AbstractContinuousWorld(ABC):
             np.fmin(closest_distances, min_dists, out=closest_distances)
 
         if include_blocks and len(self.blocks):
-            radii = np.array([s for _, s in self.blocks])
-            block_array = np.array([[pos[0], pos[1]] for pos, _ in self.blocks])
+            block_array, radii = self.get_block_arrays()
 
             dists = self.check_circle_line_intersection(
                 block_array, radii, ray_start_coords, ray_end_coords
@@ -697,9 +750,9 @@ class AbstractContinuousWorld(ABC):
                 warnings.simplefilter("ignore")
                 dists = np.nanmin(distances, axis=1)
 
-            collision_types[
-                dists < closest_distances
-            ] = CollisionType.INTERIOR_WALL.value
+            collision_types[dists < closest_distances] = (
+                CollisionType.INTERIOR_WALL.value
+            )
             np.fmin(closest_distances, dists, out=closest_distances)
 
         return closest_distances, collision_types
@@ -762,6 +762,10 @@ class DrivingContinuousModel(M.POSGModel[DState, DObs, DAction]):
 
         collision_types = [CollisionType.NONE] * len(self.possible_agents)
         new_state: List[Optional[VehicleState]] = [None] * len(self.possible_agents)
+        # block centers and min non-colliding distance to each block, shared by all
+        # vehicles this step
+        block_xy, block_r = self.world.get_block_arrays()
+        block_collision_dists = self.world.agent_radius + block_r
         for idx in range(len(self.possible_agents)):
             next_v_body_state = np.array(
                 self.world.get_entity_state(f"vehicle_{idx}"), dtype=np.float32
@@ -795,13 +799,11 @@ class DrivingContinuousModel(M.POSGModel[DState, DObs, DAction]):
                         collision_types[other_idx] = CollisionType.AGENT
             
             # Check for collisions with obstacles (blocks)
-            if not crashed and hasattr(self.world, 'blocks'):
-                for pos, radius in self.world.blocks:
-                    dist = np.linalg.norm(np.array(pos[:2]) - next_v_coords[:2])
-                    if dist <= (self.world.agent_radius + radius):
-                        crashed = True
-                        collision_types[idx] = CollisionType.BLOCK
-                        break
+            if not crashed and len(block_r):
+                block_dists = np.linalg.norm(block_xy - next_v_coords, axis=1)
+                if (block_dists <= block_collision_dists).any():
+                    crashed = True
+                    collision_types[idx] = CollisionType.BLOCK
 
             crashed = crashed or bool(state_i.status[1])
 
@@ -1,6 +1,6 @@
 """The Drone Team Capture Environment."""
 import math
-from typing import Dict, List, NamedTuple, Optional, Tuple, cast
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, cast
 
 import numpy as np
 from gymnasium import spaces
@@ -11,7 +11,6 @@ from posggym.core import DefaultEnv
 from posggym.envs.continuous.core import (
     CircularContinuousWorld,
     PMBodyState,
-    clip_actions,
 )
 from posggym.utils import seeding
 
@@ -159,6 +158,8 @@ class DroneTeamCaptureEnv(DefaultEnv[DTCState, DTCObs, DTCAction]):
         the target).
     - `use_q_reward` - Whether the pursuers should also receive the reward based on the
         `Q` parameter (default = `False`)
+    - `render_every_k` - Only redraw the environment every `k` steps, with calls to
+        `render` in between returning the last drawn frame (default = `1`)
 
 
     Available variants
@@ -206,7 +207,9 @@ class DroneTeamCaptureEnv(DefaultEnv[DTCState, DTCObs, DTCAction]):
         capture_radius: float = 30,
         use_q_reward: bool = False,
         render_mode: Optional[str] = None,
+        render_every_k: int = 1,
     ):
+        assert render_every_k >= 1
         super().__init__(
             DroneTeamCaptureModel(
                 num_agents,
@@ -229,6 +232,16 @@ class DroneTeamCaptureEnv(DefaultEnv[DTCState, DTCObs, DTCAction]):
         self.window_size = 600
         self.draw_options = None
         self.world = None
+        self.render_every_k = render_every_k
+        self._last_frame: Optional[np.ndarray] = None
+        self._last_frame_step: Optional[int] = None
+
+    def reset(
+        self, *, seed: Optional[int] = None, options: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Dict[str, DTCObs], Dict[str, Dict]]:
+        self._last_frame = None
+        self._last_frame_step = None
+        return super().reset(seed=seed, options=options)
 
     def render(self):
         if self.render_mode is None:
@@ -242,6 +255,15 @@ class DroneTeamCaptureEnv(DefaultEnv[DTCState, DTCObs, DTCAction]):
         return self._render_img()
 
     def _render_img(self):
+        if (
+            self._last_frame_step is not None
+            and self._step_num - self._last_frame_step < self.render_every_k
+        ):
+            # frame-skip, reuse last drawn frame
+            if self._last_frame is None:
+                return None
+            return self._last_frame.copy()
+
         import pygame
         from pymunk import Transform, pygame_util
 
@@ -294,6 +316,8 @@ class DroneTeamCaptureEnv(DefaultEnv[DTCState, DTCObs, DTCAction]):
         self.window_surface.fill(pygame.Color("white"))
 
         self.world.space.debug_draw(self.draw_options)
+        if self.render_every_k > 1:
+            self._last_frame_step = self._step_num
 
         if self.render_mode == "human":
             pygame.event.pump()
@@ -301,9 +325,11 @@ class DroneTeamCaptureEnv(DefaultEnv[DTCState, DTCObs, DTCAction]):
             self.clock.tick(self.metadata["render_fps"])
             return None
 
-        return np.transpose(
-            np.array(pygame.surfarray.pixels3d(self.window_surface)), axes=(1, 0, 2)
+        # array3d copies the pixels, so swapping axes can just return a view
+        self._last_frame = np.swapaxes(
+            pygame.surfarray.array3d(self.window_surface), 0, 1
         )
+        return self._last_frame.copy() if self.render_every_k > 1 else self._last_frame
 
 
 class DroneTeamCaptureModel(M.POSGModel[DTCState, DTCObs, DTCAction]):
@@ -402,6 +428,13 @@ class DroneTeamCaptureModel(M.POSGModel[DTCState, DTCObs, DTCAction]):
                 )
                 for i in self.possible_agents
             }
+        # stacked action bounds, shape = (n_pursuers, action_dim)
+        self._action_low = np.stack(
+            [self.action_spaces[i].low for i in self.possible_agents]
+        )
+        self._action_high = np.stack(
+            [self.action_spaces[i].high for i in self.possible_agents]
+        )
 
         self.obs_dim = 8 + self.n_com_pursuers * 2
         # standard range for raw observation values (before normalization to [-1, 1])
@@ -456,8 +489,9 @@ class DroneTeamCaptureModel(M.POSGModel[DTCState, DTCObs, DTCAction]):
         )
 
         # Add physical entities to the world
-        for i in range(self.n_pursuers):
-            self.world.add_entity(f"pursuer_{i}", None, color=self.PURSUER_COLOR)
+        self._pursuer_ids = tuple(f"pursuer_{i}" for i in range(self.n_pursuers))
+        for pursuer_id in self._pursuer_ids:
+            self.world.add_entity(pursuer_id, None, color=self.PURSUER_COLOR)
         self.world.add_entity("evader", None, color=self.EVADER_COLOR)
 
     def get_agents(self, state: DTCState) -> List[str]:
@@ -484,10 +518,11 @@ class DroneTeamCaptureModel(M.POSGModel[DTCState, DTCObs, DTCAction]):
         pursuer_states = np.zeros(
             (self.n_pursuers, PMBodyState.num_features()), dtype=np.float32
         )
-        for i in range(self.n_pursuers):
-            # distributes the agents based on their index
-            x = 50.0 * (-math.floor(self.n_pursuers / 2) + i) + self.r_arena
-            pursuer_states[i][:3] = (x, self.r_arena, 0.0)
+        # distributes the agents based on their index
+        pursuer_states[:, 0] = (
+            50.0 * (np.arange(self.n_pursuers) - self.n_pursuers // 2) + self.r_arena
+        )
+        pursuer_states[:, 1] = self.r_arena
 
         # Target is placed randomly in sphere,
         # excluding area near center where pursuers start
@@ -523,10 +558,15 @@ class DroneTeamCaptureModel(M.POSGModel[DTCState, DTCObs, DTCAction]):
     def step(
         self, state: DTCState, actions: Dict[str, DTCAction]
     ) -> M.JointTimestep[DTCState, DTCObs]:
-        clipped_actions = clip_actions(actions, self.action_spaces)
-        next_state = self._get_next_state(state, clipped_actions)
+        # stack and clip actions once, shape = (n_pursuers, action_dim)
+        action_arr = np.array(
+            [actions[i] for i in self.possible_agents], dtype=np.float64
+        )
+        np.clip(action_arr, self._action_low, self._action_high, out=action_arr)
+        next_state = self._get_next_state(state, action_arr)
         obs = self._get_obs(next_state)
-        all_done, rewards = self._get_rewards(next_state)
+        target_dists = self._compute_target_dists(next_state)
+        all_done, rewards = self._get_rewards(next_state, target_dists)
         terminations = {i: all_done for i in self.possible_agents}
         truncations = {i: False for i in self.possible_agents}
         infos: Dict[str, Dict] = {i: {} for i in self.possible_agents}
@@ -534,21 +574,19 @@ class DroneTeamCaptureModel(M.POSGModel[DTCState, DTCObs, DTCAction]):
             next_state, obs, rewards, terminations, truncations, all_done, infos
         )
 
-    def _get_next_state(
-        self, state: DTCState, actions: Dict[str, DTCAction]
-    ) -> DTCState:
-        for i in range(self.n_pursuers):
-            self.world.set_entity_state(f"pursuer_{i}", state.pursuer_states[i])
-            velocity_factor = 1 if not self.velocity_control else actions[str(i)][1]
-            pursuer_angle = state.pursuer_states[i][2] + actions[str(i)][0]
-            pursuer_vel = self.world.linear_to_xy_velocity(
-                velocity_factor * self.max_pursuer_vel, pursuer_angle
-            )
-            self.world.update_entity_state(
-                f"pursuer_{i}",
-                angle=pursuer_angle,
-                vel=pursuer_vel,
-            )
+    def _get_next_state(self, state: DTCState, actions: np.ndarray) -> DTCState:
+        next_pursuer_states = state.pursuer_states.astype(np.float64)
+        next_pursuer_states[:, 2] = state.pursuer_states[:, 2] + actions[:, 0].astype(
+            np.float32
+        )
+        if self.velocity_control:
+            vels = self.max_pursuer_vel * actions[:, 1]
+        else:
+            # all pursuers move at the same fixed speed, so broadcast a scalar
+            vels = float(self.max_pursuer_vel)
+        next_pursuer_states[:, 3] = vels * np.cos(next_pursuer_states[:, 2])
+        next_pursuer_states[:, 4] = vels * np.sin(next_pursuer_states[:, 2])
+        self.world.set_entity_states(self._pursuer_ids, next_pursuer_states)
 
         evader_vel_xy = self._get_target_move_repulsive(state)
         self.world.set_entity_state("evader", state.target_state)
@@ -556,110 +594,134 @@ class DroneTeamCaptureModel(M.POSGModel[DTCState, DTCObs, DTCAction]):
 
         self.world.simulate(1.0 / 10, 10, normalize_angles=True)
 
-        next_pursuer_states = np.array(
-            [
-                self.world.get_entity_state(f"pursuer_{i}")
-                for i in range(self.n_pursuers)
-            ],
-            dtype=np.float32,
-        )
+        # state arrays are never modified in-place, so the current state's arrays can
+        # be shared as the next state's previous arrays rather than copied
         return DTCState(
-            next_pursuer_states,
-            np.copy(state.pursuer_states),
-            np.array(self.world.get_entity_state("evader"), dtype=np.float32),
-            np.copy(state.target_state),
+            self.world.get_entity_states(self._pursuer_ids),
+            state.pursuer_states,
+            self.world.get_entity_states(("evader",))[0],
+            state.target_state,
             state.target_vel,
         )
 
     def _get_obs(self, state: DTCState) -> Dict[str, DTCObs]:
-        observation = {}
-        for i in range(self.n_pursuers):
-            # getting the target engagement
-            (alpha_t, dist_t), target_visible = self._engagement(
-                state.pursuer_states[i],
-                state.target_state,
-                dist_norm_factor=2 * self.r_arena,
-            )
-            (alpha_t_prev, dist_t_prev), target_prev_visible = self._engagement(
-                state.prev_pursuer_states[i],
-                state.prev_target_state,
-                dist_norm_factor=2 * self.r_arena,
-            )
-            # change in alpha
-            if not target_visible or not target_prev_visible:
-                alpha_rate = -1.0
-                dist_rate = -1.0
-            else:
-                # alpha_t and alpha_t_prev are both normalized into [-1, 1] range
-                # so have to do some shenanigans to ensure alpha rate is correctly
-                # normalized into [-1, 1]
-                alpha_rate = (
-                    self.world.convert_angle_to_negpi_pi_interval(
-                        (alpha_t - alpha_t_prev) * math.pi
-                    )
-                    / math.pi
-                )
-                max_rate = self.norm_max_rel_dist_change
-                dist_rate = self.world.convert_into_interval(
-                    dist_t - dist_t_prev, -max_rate, max_rate, -1.0, 1.0
-                )
+        dist_norm_factor = 2 * self.r_arena
+        # getting the target engagement, for current and previous step together
+        # each has shape (2 * n_pursuers, 1), with current step in first half
+        n = self.n_pursuers
+        targets = np.empty((2 * n, 1, PMBodyState.num_features()), dtype=np.float32)
+        targets[:n, 0] = state.target_state
+        targets[n:, 0] = state.prev_target_state
+        all_alpha_t, all_dist_t, all_target_visible = self._engagements(
+            np.concatenate([state.pursuer_states, state.prev_pursuer_states]),
+            targets,
+            dist_norm_factor,
+        )
+        alpha_t, alpha_t_prev = all_alpha_t[:n], all_alpha_t[n:]
+        dist_t, dist_t_prev = all_dist_t[:n], all_dist_t[n:]
+        target_visible, target_prev_visible = (
+            all_target_visible[:n],
+            all_target_visible[n:],
+        )
 
-            # getting the relative engagement
-            # alpha and distance to each pursuer
-            engagement = []
-            for j in range(self.n_pursuers):
-                if j == i:
-                    eng = (-1.0, -1.0)
-                else:
-                    eng, _ = self._engagement(
-                        state.pursuer_states[i],
-                        state.pursuer_states[j],
-                        dist_norm_factor=2 * self.r_arena,
-                    )
-                engagement.append(eng)
-
-            # Put any invalid (-1) to the end
-            engagement = sorted(
-                engagement, key=lambda t: float("inf") if t[1] == -1.0 else t[1]
-            )
-            alphas, dists = list(zip(*engagement))
+        # getting the relative engagement
+        # alpha and distance from each pursuer to each other pursuer
+        # each has shape (n_pursuers, n_pursuers)
+        alphas, dists, _ = self._engagements(
+            state.pursuer_states, state.pursuer_states, dist_norm_factor
+        )
+        np.fill_diagonal(alphas, -1.0)
+        np.fill_diagonal(dists, -1.0)
+
+        # Select the n_com_pursuers closest other pursuers, sorted by distance, putting
+        # any invalid (-1) to the end
+        k = self.n_com_pursuers
+        sort_dists = np.where(dists == -1.0, np.inf, dists)
+        closest = np.argpartition(sort_dists, k - 1, axis=1)[:, :k]
+        order = np.take_along_axis(
+            closest,
+            np.argsort(
+                np.take_along_axis(sort_dists, closest, axis=1), axis=1, kind="stable"
+            ),
+            axis=1,
+        )
+        alphas = np.take_along_axis(alphas, order, axis=1)
+        dists = np.take_along_axis(dists, order, axis=1)
+
+        # change in alpha and distance to target
+        # alpha_t and alpha_t_prev are both normalized into [-1, 1] range so have to
+        # do some shenanigans to ensure alpha rate is correctly normalized into [-1, 1]
+        alpha_diffs = (alpha_t[:, 0] - alpha_t_prev[:, 0]).astype(np.float64) * math.pi
+        alpha_rates = _wrap_angles(alpha_diffs) / math.pi
+        max_rate = self.norm_max_rel_dist_change
+        dist_rates = self.world.convert_into_interval(
+            (dist_t[:, 0] - dist_t_prev[:, 0]).astype(np.float64),
+            -max_rate,
+            max_rate,
+            -1.0,
+            1.0,
+        )
+        rate_invisible = ~(target_visible[:, 0] & target_prev_visible[:, 0])
+        alpha_rates[rate_invisible] = -1.0
+        dist_rates[rate_invisible] = -1.0
 
-            angle_i = (
-                self.world.convert_angle_to_negpi_pi_interval(
-                    state.pursuer_states[i][2]
-                )
-                / math.pi
-            )
-            prev_angle_i = (
-                self.world.convert_angle_to_negpi_pi_interval(
-                    state.prev_pursuer_states[i][2]
-                )
-                / math.pi
-            )
-            turn_rate = (angle_i - prev_angle_i) / 2
-            xy_i = self.world.convert_into_interval(
-                state.pursuer_states[i][:2], 0.0, 2 * self.r_arena, -1.0, 1.0
-            )
+        angles = _wrap_angles(state.pursuer_states[:, 2].astype(np.float64)) / math.pi
+        prev_angles = (
+            _wrap_angles(state.prev_pursuer_states[:, 2].astype(np.float64)) / math.pi
+        )
+
+        # Create obs vectors, one row per pursuer
+        obs = np.empty((self.n_pursuers, self.obs_dim), dtype=np.float32)
+        obs[:, 0] = angles
+        obs[:, 1] = (angles - prev_angles) / 2
+        obs[:, 2:4] = self.world.convert_into_interval(
+            state.pursuer_states[:, :2], 0.0, 2 * self.r_arena, -1.0, 1.0
+        )
+        obs[:, 4] = alpha_t[:, 0]
+        obs[:, 5] = dist_t[:, 0]
+        obs[:, 6] = alpha_rates
+        obs[:, 7] = dist_rates
+        obs[:, 8::2] = alphas
+        obs[:, 9::2] = dists
+
+        return dict(zip(self.possible_agents, obs))
+
+    def _engagements(
+        self, agents: np.ndarray, others: np.ndarray, dist_norm_factor: float
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get engagement between each agent and each other agent.
+
+        Vectorized version of `_engagement`. `agents` should have shape `(n, F)` and
+        `others` should have shape `(m, F)` (the same others for every agent) or
+        `(n, m, F)` (different others for each agent), where each row is an entity
+        state.
 
-            # Create obs vector
-            obs_i = [
-                angle_i,
-                turn_rate,
-                xy_i[0],
-                xy_i[1],
-                alpha_t,
-                dist_t,
-                alpha_rate,
-                dist_rate,
-            ]
+        Returns the normalized angles, normalized distances, and whether each other
+        agent is within observation distance, each with shape `(n, m)`. Angle and
+        distance are `-1` for any other agent outside of observation distance.
 
-            for idx in range(self.n_com_pursuers):
-                obs_i.append(alphas[idx])
-                obs_i.append(dists[idx])
+        """
+        rel_x = others[..., 0] - agents[:, 0, None]
+        rel_y = others[..., 1] - agents[:, 1, None]
+        dists = np.hypot(rel_x, rel_y)
+
+        # Rotate relative position by yaw of each agent
+        cos_yaw = np.cos(agents[:, 2, None])
+        sin_yaw = np.sin(agents[:, 2, None])
+        alphas = np.arctan2(
+            -sin_yaw * rel_x + cos_yaw * rel_y, cos_yaw * rel_x + sin_yaw * rel_y
+        )
+        alphas /= math.pi
 
-            observation[str(i)] = np.array(obs_i, dtype=np.float32)
+        if self.observation_limit is None:
+            dists /= dist_norm_factor
+            return alphas, dists, np.ones(dists.shape, dtype=bool)
 
-        return observation
+        visible = dists <= self.observation_limit
+        dists /= dist_norm_factor
+        alphas[~visible] = -1.0
+        dists[~visible] = -1.0
+        return alphas, dists, visible
 
     def _engagement(
         self, agent_i: np.ndarray, agent_j: np.ndarray, dist_norm_factor: float
@@ -678,26 +740,25 @@ class DroneTeamCaptureModel(M.POSGModel[DTCState, DTCObs, DTCAction]):
         if self.observation_limit is not None and dist > self.observation_limit:
             return (-1.0, -1.0), False
 
-        # Rotation matrix of yaw
-        yaw = agent_i[2]
-        rot = np.array(
-            [[math.cos(yaw), math.sin(yaw)], [-math.sin(yaw), math.cos(yaw)]]
-        )
-        rel_xy = agent_j[:2] - agent_i[:2]
-        rel_xy = rot.dot(rel_xy)
-        alpha = math.atan2(rel_xy[1], rel_xy[0])
+        # Rotate relative position by yaw
+        cos_yaw, sin_yaw = math.cos(agent_i[2]), math.sin(agent_i[2])
+        dx, dy = agent_j[0] - agent_i[0], agent_j[1] - agent_i[1]
+        alpha = math.atan2(-sin_yaw * dx + cos_yaw * dy, cos_yaw * dx + sin_yaw * dy)
         alpha = self.world.convert_angle_to_negpi_pi_interval(alpha)
         return (alpha / math.pi, dist / dist_norm_factor), True
 
-    def _get_rewards(self, state: DTCState) -> Tuple[bool, Dict[str, float]]:
+    def _get_rewards(
+        self, state: DTCState, target_dists: np.ndarray
+    ) -> Tuple[bool, Dict[str, float]]:
         done = False
         reward: Dict[str, float] = {}
         # q_formation reward: [-1 * (n-1) / n, 3 * (n-1) / n]
-        q_formation = self._q_parameter(state) if self.use_q_reward else 0.0
-        for i in self.possible_agents:
+        q_formation = (
+            self._q_parameter(state, target_dists) if self.use_q_reward else 0.0
+        )
+        for i, target_dist in zip(self.possible_agents, target_dists.tolist()):
             reward[i] = self.R_Q_COEFF * q_formation
             # target_dist range = (0.0, 2*r_arena) = (0.0, 860) for default size
-            target_dist = self._target_distance(state, int(i))
             # target_dist reward = (-1.72, 0.0) for default size
             reward[i] += self.R_TARGET_DIST_COEFF * target_dist
             if target_dist < self.capture_radius:
@@ -711,83 +772,62 @@ class DroneTeamCaptureModel(M.POSGModel[DTCState, DTCObs, DTCAction]):
 
         return done, reward
 
-    def _q_parameter(self, state: DTCState) -> float:
+    def _q_parameter(self, state: DTCState, target_dists: np.ndarray) -> float:
         """Calculate Q-formation value."""
         # min = -1 * (n-1) / n, max = 3 * (n-1) / n
-        closest = self._get_closest_pursuer(state)
-        unit = self._get_unit_vectors(state)
-        Qk = 0.0
-        for i in range(self.n_pursuers):
-            if i != closest:
-                Qk += np.dot(unit[i], unit[closest]) + 1.0
-        Qk /= self.n_pursuers
-        return Qk
-
-    def _get_closest_pursuer(self, state: DTCState) -> int:
-        """Get closest pursuer to target."""
-        min_dist, min_index = None, None
-        for idx in range(len(state.pursuer_states)):
-            dist = self._target_distance(state, idx)
-            if min_dist is None or dist < min_dist:
-                min_index = idx
-                min_dist = dist
-        if min_dist is None or min_index is None:
-            raise Exception("No closest index found. Something has gone wrong.")
-        return min_index
-
-    def _get_unit_vectors(self, state: DTCState) -> List[List[float]]:
-        """Get unit vectors between target and each pursuer."""
-        unit = []
-        q = state.target_state[:2]
-        for p in state.pursuer_states:
-            dist = self.world.euclidean_dist(p, state.target_state)
-            unit.append([(q[0] - p[0]) / dist, (q[1] - p[1]) / dist])
-        return unit
+        closest = int(np.argmin(target_dists))
+        # unit vectors between target and each pursuer
+        rel_xy = state.target_state[:2] - state.pursuer_states[:, :2]
+        unit = rel_xy / target_dists[:, None]
+        dots = unit @ unit[closest] + 1.0
+        dots[closest] = 0.0
+        return float(dots.sum()) / self.n_pursuers
 
     def _get_target_move_repulsive(self, state: DTCState) -> Tuple[float, float]:
         xy_pos = state.target_state[:2]
-        x, y = xy_pos
-
-        def scale_fn(z):
-            return 50000 / (abs(z) + 200) ** 2
+        x, y = xy_pos.tolist()
 
-        final_vector = [0.0, 0.0]
-        for s in state.pursuer_states:
-            vector = s[:2] - xy_pos
-            final_vector = self._scale_vector(vector, scale_fn, final_vector)
+        # Sum of repulsion from each pursuer
+        vectors = state.pursuer_states[:, :2] - xy_pos
+        vec_sums = np.abs(vectors).sum(axis=1)
+        f = -_repulsion_scale(vec_sums) / np.maximum(0.00001, vec_sums)
+        dx, dy = (f[:, None] * vectors).sum(axis=0).tolist()
 
         # Find closest point on border then put it in to the vectorial sum
         # Noting coords are with origin at top left, so must translate to where origin
         # is center of circle to get closest point on border, then translate back before
         # adding to vectorial sum
+        # This is a single 2D vector so plain float math is faster than numpy here
         gamma = -math.atan2(y - self.r_arena, x - self.r_arena)
-        virtual_wall = [
-            self.r_arena + self.r_arena * math.cos(gamma),
-            self.r_arena - self.r_arena * math.sin(gamma),
-        ]
-        vector = virtual_wall - xy_pos
-        final_vector = self._scale_vector(
-            vector, scale_fn, final_vector, 0.5 * len(state.pursuer_states)
+        wall_dx = self.r_arena + self.r_arena * math.cos(gamma) - x
+        wall_dy = self.r_arena - self.r_arena * math.sin(gamma) - y
+        wall_sum = abs(wall_dx) + abs(wall_dy)
+        f_wall = (
+            -0.5 * self.n_pursuers * _repulsion_scale(wall_sum) / max(0.00001, wall_sum)
         )
+        dx += f_wall * wall_dx
+        dy += f_wall * wall_dy
+
+        d = math.hypot(dx, dy)
+        return state.target_vel * dx / d, state.target_vel * dy / d
 
-        scaled_move_dir = [v / self._abs_sum(final_vector) for v in final_vector]
-        dx, dy = scaled_move_dir[0], scaled_move_dir[1]
-        d = np.linalg.norm([dx, dy])
-        dx = float(state.target_vel * dx / d)
-        dy = float(state.target_vel * dy / d)
-        return dx, dy
-
-    def _scale_vector(self, vector, scale_fn, final_vector, factor=1.0) -> List[float]:
-        vec_sum = self._abs_sum(vector)
-        div = max(0.00001, vec_sum)
-        f = -factor * scale_fn(vec_sum) / div
-        vector = f * vector
-        return [x + y for x, y in zip(final_vector, vector)]
-
-    def _abs_sum(self, vector: List[float]) -> float:
-        return sum([abs(x) for x in vector])
-
-    def _target_distance(self, state: DTCState, pursuer_idx: int) -> float:
-        return self.world.euclidean_dist(
-            state.pursuer_states[pursuer_idx], state.target_state
+    def _compute_target_dists(self, state: DTCState) -> np.ndarray:
+        """Get distance between each pursuer and the target."""
+        return np.linalg.norm(
+            state.pursuer_states[:, :2] - state.target_state[:2], axis=1
         )
+
+
+def _repulsion_scale(z):
+    """Scale of repulsion from entity at (L1) distance `z` from the target."""
+    return 50000 / (abs(z) + 200) ** 2
+
+
+def _wrap_angles(angles: np.ndarray) -> np.ndarray:
+    """Convert array of angles in radians to be in (-pi, pi] interval.
+
+    Vectorized version of `CircularContinuousWorld.convert_angle_to_negpi_pi_interval`.
+    """
+    angles = np.mod(angles, 2 * math.pi)
+    angles[angles > math.pi] -= 2 * math.pi
+    return angles
@@ -1,8 +1,9 @@
 """The Continuous Predator-Prey Environment."""
 
 import math
-from itertools import product
-from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union, cast
+import warnings
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union, cast
 
 import numpy as np
 from gymnasium import spaces
@@ -15,7 +16,6 @@ from posggym.envs.continuous.core import (
     PMBodyState,
     Position,
     SquareContinuousWorld,
-    clip_actions,
 )
 from posggym.utils import seeding
 
@@ -48,7 +48,7 @@ class PredatorPreyContinuousEnv(DefaultEnv[PPState, PPObs, PPAction]):
 
     1. 2D array containing the state of each predator
     2. 2D array containing the state of each prey
-    3. 1D array containing whether each prey has been caught or not (0=no, 1=yes)
+    3. 1D array containing whether each prey has been caught or not (True=yes)
 
     The state of each predator and prey is a 1D array containing their:
 
@@ -235,6 +235,10 @@ class PredatorPreyContinuousEnv(DefaultEnv[PPState, PPObs, PPAction]):
         self.window_size = 600
         self.draw_options = None
         self.world = None
+        # sensor angles relative to predator angle, used for drawing sensor lines
+        sensor_angles = np.arange(n_sensors) * (2 * math.pi / n_sensors)
+        self._sensor_cos = np.cos(sensor_angles)
+        self._sensor_sin = np.sin(sensor_angles)
 
     def render(self):
         if self.render_mode is None:
@@ -288,35 +292,34 @@ class PredatorPreyContinuousEnv(DefaultEnv[PPState, PPObs, PPAction]):
             # affecting the original
             self.world = model.world.copy()
 
-        for i, p_state in enumerate(state.predator_states):
-            self.world.set_entity_state(f"pred_{i}", p_state)
-
-        for i, p_state in enumerate(state.prey_states):
-            self.world.set_entity_state(f"prey_{i}", p_state)
-
-        # Need to do this for space to update with changes
-        self.world.space.step(0.0001)
+        self.world.set_entity_states(model._pred_ids, state.predator_states)
+        self.world.set_entity_states(model._prey_ids, state.prey_states)
+        # update shapes for drawing, without stepping the space
+        self.world.sync_entity_shapes(model._pred_ids + model._prey_ids)
 
         # reset screen
         self.window_surface.fill(pygame.Color("white"))
 
         # draw sensor lines
+        # each predator's sensor lines are drawn as a single polyline which goes out
+        # and back along each sensor line, i.e. start, end_0, start, end_1, ...
         n_sensors = model.n_sensors
-        for i, obs_i in self._last_obs.items():
-            p_state = state.predator_states[int(i)]
-            x, y, agent_angle = p_state[:3]
-            angle_inc = 2 * math.pi / n_sensors
-            for k in range(n_sensors):
-                dist = min(obs_i[k], obs_i[n_sensors + k], obs_i[2 * n_sensors + k])
-                angle = angle_inc * k + agent_angle
-                end_x = x + dist * math.cos(angle)
-                end_y = y + dist * math.sin(angle)
-                scaled_start = (int(x * scale_factor), int(y * scale_factor))
-                scaled_end = int(end_x * scale_factor), (end_y * scale_factor)
-
-                pygame.draw.line(
-                    self.window_surface, pygame.Color("red"), scaled_start, scaled_end
-                )
+        points = np.empty((2 * n_sensors, 2))
+        for p_state, obs_i in zip(state.predator_states, self._last_obs.values()):
+            x, y, agent_angle = p_state[:3].tolist()
+            cos_a, sin_a = math.cos(agent_angle), math.sin(agent_angle)
+            dists = obs_i.reshape(3, n_sensors).min(axis=0)
+            points[0::2] = (x, y)
+            points[1::2, 0] = x + dists * (
+                self._sensor_cos * cos_a - self._sensor_sin * sin_a
+            )
+            points[1::2, 1] = y + dists * (
+                self._sensor_sin * cos_a + self._sensor_cos * sin_a
+            )
+            points *= scale_factor
+            pygame.draw.lines(
+                self.window_surface, pygame.Color("red"), False, points.tolist()
+            )
 
         self.world.space.debug_draw(self.draw_options)
 
@@ -418,6 +421,9 @@ class PredatorPreyContinuousModel(M.POSGModel[PPState, PPObs, PPAction]):
         self.n_sensors = n_sensors
         # capture radius large enough so prey in corner can be captured by 3 predators
         self.prey_capture_dist = 2.75 * self.world.agent_radius
+        # squared distance thresholds, compared against float32 squared distances
+        self._prey_capture_dist_sq = np.float32(self.prey_capture_dist**2)
+        self._prey_obs_dist_sq = np.float32(self.prey_obs_dist**2)
         self.possible_agents = tuple((str(x) for x in range(self.num_predators)))
 
         def _pos_space(n_agents: int):
@@ -454,6 +460,13 @@ class PredatorPreyContinuousModel(M.POSGModel[PPState, PPObs, PPAction]):
             )
             for i in self.possible_agents
         }
+        # stacked action bounds, shape = (num_predators, action_dim)
+        self._action_low = np.stack(
+            [self.action_spaces[i].low for i in self.possible_agents]
+        )
+        self._action_high = np.stack(
+            [self.action_spaces[i].high for i in self.possible_agents]
+        )
 
         self.obs_dim = self.n_sensors * 3
         self.observation_spaces = {
@@ -462,16 +475,25 @@ class PredatorPreyContinuousModel(M.POSGModel[PPState, PPObs, PPAction]):
             )
             for i in self.possible_agents
         }
+        # sensor constants used by `get_obs`, fixed for the lifetime of the model
+        self._sensor_angles = np.linspace(
+            0.0, 2 * np.pi, self.n_sensors, endpoint=False, dtype=np.float32
+        )
+        self._sensor_idx = np.arange(self.n_sensors)
+        self._pred_radii = np.full(self.num_predators, self.world.agent_radius)
+        self._pred_idx = np.arange(self.num_predators)
 
         # All predators are identical so env is symmetric
         self.is_symmetric = True
 
         # Add physical entities to the world
-        for i in range(self.num_predators):
-            self.world.add_entity(f"pred_{i}", None, color=self.PREDATOR_COLOR)
+        self._pred_ids = tuple(f"pred_{i}" for i in range(self.num_predators))
+        for id in self._pred_ids:
+            self.world.add_entity(id, None, color=self.PREDATOR_COLOR)
 
-        for i in range(self.num_prey):
-            self.world.add_entity(f"prey_{i}", None, color=self.PREY_COLOR)
+        self._prey_ids = tuple(f"prey_{i}" for i in range(self.num_prey))
+        for id in self._prey_ids:
+            self.world.add_entity(id, None, color=self.PREY_COLOR)
 
     @property
     def reward_ranges(self) -> Dict[str, Tuple[float, float]]:
@@ -487,26 +509,27 @@ class PredatorPreyContinuousModel(M.POSGModel[PPState, PPObs, PPAction]):
         return list(self.possible_agents)
 
     def sample_initial_state(self) -> PPState:
-        predator_positions = [*self.world.predator_start_positions]
-        self.rng.shuffle(predator_positions)
+        # shuffle row indices rather than the position arrays themselves
+        predator_idxs = list(range(len(self.world.predator_start_positions)))
+        self.rng.shuffle(predator_idxs)
         predator_states = np.zeros(
             (self.num_predators, PMBodyState.num_features()), dtype=np.float32
         )
-        for i in range(self.num_predators):
-            predator_states[i][:3] = predator_positions[i]
+        predator_states[:, :3] = self.world.predator_start_positions[
+            predator_idxs[: self.num_predators]
+        ]
 
-        prey_positions = [*self.world.prey_start_positions]
-        self.rng.shuffle(prey_positions)
+        prey_idxs = list(range(len(self.world.prey_start_positions)))
+        self.rng.shuffle(prey_idxs)
         prey_states = np.zeros(
             (self.num_prey, PMBodyState.num_features()), dtype=np.float32
         )
-        for i in range(self.num_prey):
-            prey_states[i][:3] = prey_positions[i]
+        prey_states[:, :3] = self.world.prey_start_positions[prey_idxs[: self.num_prey]]
 
         return PPState(
             predator_states,
             prey_states,
-            np.zeros(self.num_prey, dtype=np.int8),
+            np.zeros(self.num_prey, dtype=bool),
         )
 
     def sample_initial_obs(self, state: PPState) -> Dict[str, PPObs]:
@@ -515,15 +538,20 @@ class PredatorPreyContinuousModel(M.POSGModel[PPState, PPObs, PPAction]):
     def step(
         self, state: PPState, actions: Dict[str, PPAction]
     ) -> M.JointTimestep[PPState, PPObs]:
-        clipped_actions = clip_actions(actions, self.action_spaces)
+        # act[:, 0] = angular velocity, act[:, 1] = linear velocity
+        act = np.array([actions[i] for i in self.possible_agents], dtype=np.float32)
+        np.clip(act, self._action_low, self._action_high, out=act)
 
-        next_state = self._get_next_state(state, clipped_actions)
+        next_state, pred_dists_sq = self._get_next_state(state, act)
         obs = self.get_obs(next_state)
-        rewards = self._get_rewards(state, next_state)
+        rewards = self._get_rewards(state, next_state, pred_dists_sq)
 
-        all_done = all(next_state.prey_caught)
-        truncated = {i: False for i in self.possible_agents}
-        terminated = {i: all_done for i in self.possible_agents}
+        # Returned dicts are built fresh each step, rather than shared between steps,
+        # since wrappers may modify them in place (e.g. `TimeLimit` sets truncated).
+        # `dict.fromkeys` is used where values are immutable, as it's cheaper.
+        all_done = bool(next_state.prey_caught.all())
+        truncated = dict.fromkeys(self.possible_agents, False)
+        terminated = dict.fromkeys(self.possible_agents, all_done)
 
         info: Dict[str, Dict] = {i: {} for i in self.possible_agents}
         if all_done:
@@ -534,131 +562,167 @@ class PredatorPreyContinuousModel(M.POSGModel[PPState, PPObs, PPAction]):
             next_state, obs, rewards, terminated, truncated, all_done, info
         )
 
-    def _get_next_state(self, state: PPState, actions: Dict[str, PPAction]) -> PPState:
+    def _get_next_state(
+        self, state: PPState, actions: np.ndarray
+    ) -> Tuple[PPState, np.ndarray]:
+        """Get next state, along with squared distance from each prey to each predator.
+
+        Squared distances are computed using prey positions after moving but before
+        any newly caught prey are removed, and are reused by `_get_rewards`.
+        """
         prey_move_angles = self._get_prey_move_angles(state)
 
-        # apply prey actions
-        for i in range(self.num_prey):
-            self.world.set_entity_state(f"prey_{i}", state.prey_states[i])
-            if state.prey_caught[i]:
-                # do nothing
-                continue
-            self.world.update_entity_state(
-                f"prey_{i}",
-                angle=prey_move_angles[i],
-                vel=self.world.linear_to_xy_velocity(
-                    self.PREY_STEP_VEL, prey_move_angles[i]
-                ),
-            )
+        # apply prey actions, caught prey do nothing
+        prey_states = state.prey_states.astype(np.float64)
+        active = ~state.prey_caught
+        prey_angles = np.array(prey_move_angles, dtype=np.float64)[active]
+        prey_states[active, 2] = prey_angles
+        prey_states[active, 3] = self.PREY_STEP_VEL * np.cos(prey_angles)
+        prey_states[active, 4] = self.PREY_STEP_VEL * np.sin(prey_angles)
+        self.world.set_entity_states(self._prey_ids, prey_states)
 
         # apply predator actions
-        for i in range(self.num_predators):
-            action = actions[str(i)]
-            self.world.set_entity_state(f"pred_{i}", state.predator_states[i])
-            angle = state.predator_states[i][2] + action[0]
-            self.world.update_entity_state(
-                f"pred_{i}",
-                angle=angle,
-                vel=self.world.linear_to_xy_velocity(action[1], angle),
-            )
+        pred_states = state.predator_states.astype(np.float64)
+        pred_states[:, 2] = state.predator_states[:, 2] + actions[:, 0]
+        pred_states[:, 3] = actions[:, 1] * np.cos(pred_states[:, 2])
+        pred_states[:, 4] = actions[:, 1] * np.sin(pred_states[:, 2])
+        self.world.set_entity_states(self._pred_ids, pred_states)
 
         # simulate
         self.world.simulate(1.0 / 10, 10)
 
         # extract next state
-        next_pred_states = np.array(
-            [
-                self.world.get_entity_state(f"pred_{i}")
-                for i in range(self.num_predators)
-            ],
-            dtype=np.float32,
-        )
+        next_pred_states = self.world.get_entity_states(self._pred_ids)
+        next_prey_states = self.world.get_entity_states(self._prey_ids)
 
-        next_prey_states = np.array(
-            [self.world.get_entity_state(f"prey_{i}") for i in range(self.num_prey)],
-            dtype=np.float32,
+        # prey are caught when enough predators are within capture distance
+        _, pred_dists_sq = _pairwise_diffs(
+            next_prey_states[:, :2], next_pred_states[:, :2]
         )
+        n_close = (pred_dists_sq <= self._prey_capture_dist_sq).sum(axis=1)
+        next_prey_caught = state.prey_caught | (n_close >= self.prey_strength)
+        next_prey_states[next_prey_caught] = [-1.0, -1.0, 0.0, 0.0, 0.0, 0.0]
 
-        next_prey_caught = state.prey_caught.copy()
-        for i in range(self.num_prey):
-            if state.prey_caught[i]:
-                next_prey_states[i] = [-1.0, -1.0, 0.0, 0.0, 0.0, 0.0]
-                continue
-            pred_dists = np.linalg.norm(
-                next_prey_states[i][:2] - next_pred_states[:, :2], axis=1
-            )
-            if (
-                np.where(pred_dists <= self.prey_capture_dist, 1, 0).sum()
-                >= self.prey_strength
-            ):
-                next_prey_caught[i] = 1
-                next_prey_states[i] = [-1.0, -1.0, 0.0, 0.0, 0.0, 0.0]
-
-        return PPState(next_pred_states, next_prey_states, next_prey_caught)
+        return (
+            PPState(next_pred_states, next_prey_states, next_prey_caught),
+            pred_dists_sq,
+        )
 
     def _get_prey_move_angles(self, state: PPState) -> List[float]:
         prey_actions = []
-        active_prey = self.num_prey - state.prey_caught.sum()
+        # squared distance from each prey to each predator and to each other prey,
+        # with distance to itself and to caught prey set to inf so they're ignored
+        prey_xy = state.prey_states[:, :2]
+        pred_diffs, all_pred_dists = _pairwise_diffs(
+            prey_xy, state.predator_states[:, :2]
+        )
+        prey_diffs, all_prey_dists = _pairwise_diffs(prey_xy, prey_xy)
+        # xy offsets as nested lists, so move angles are computed on python floats
+        pred_diffs, prey_diffs = pred_diffs.tolist(), prey_diffs.tolist()
+        all_prey_dists[:, state.prey_caught] = np.inf
+        np.fill_diagonal(all_prey_dists, np.inf)
+        all_pred_dists, all_prey_dists = (
+            all_pred_dists.tolist(),
+            all_prey_dists.tolist(),
+        )
+        max_dist = float(self._prey_obs_dist_sq)
+        # bind rng method once, since it's used for every prey that moves randomly
+        rand = self.rng.random
         for i in range(self.num_prey):
             if state.prey_caught[i]:
                 # prey stays in same position
                 prey_actions.append(0.0)
                 continue
 
-            prey_state = state.prey_states[i]
-            # try move away from predators
-            pred_states = state.predator_states
-            pred_dists = np.linalg.norm(prey_state[:2] - pred_states[:, :2], axis=1)
-            min_pred_dist = pred_dists.min()
-            if min_pred_dist <= self.prey_obs_dist:
-                # get any predators within obs distance
-                pred_idx = self.rng.choice(np.where(pred_dists == min_pred_dist)[0])
-                pred_state = state.predator_states[pred_idx]
-                angle = math.atan2(
-                    prey_state[1] - pred_state[1], prey_state[0] - pred_state[0]
-                )
-                prey_actions.append(angle)
-                continue
-
-            if active_prey == 1:
-                # no other prey to move away from so just move randomly
-                angle = self.rng.uniform(0, 2 * math.pi)
+            # try move away from closest predator within obs distance
+            pred_idx = _argmin_random_tie(all_pred_dists[i], max_dist, rand)
+            if pred_idx >= 0:
+                dx, dy = pred_diffs[i][pred_idx]
+                angle = math.atan2(dy, dx)
                 prey_actions.append(angle)
                 continue
 
-            # try move away from prey
-            prey_dists = [
-                np.linalg.norm(prey_state[:2] - p[:2])
-                for j, p in enumerate(state.prey_states)
-                if not state.prey_caught[j] and j != i
-            ]
-            min_prey_dist = min(prey_dists)
-            if min_prey_dist <= self.prey_obs_dist:
-                other_prey_idx = self.rng.choice(
-                    np.where(prey_dists == min_prey_dist)[0]
-                )
-                other_prey_state = state.prey_states[other_prey_idx]
-                angle = math.atan2(
-                    prey_state[1] - other_prey_state[1],
-                    prey_state[0] - other_prey_state[0],
-                )
+            # try move away from prey, if there are no other prey then all distances
+            # are inf and prey moves randomly
+            other_prey_idx = _argmin_random_tie(all_prey_dists[i], max_dist, rand)
+            if other_prey_idx >= 0:
+                dx, dy = prey_diffs[i][other_prey_idx]
+                angle = math.atan2(dy, dx)
                 prey_actions.append(angle)
                 continue
 
             # move in random direction
-            angle = self.rng.uniform(0, 2 * math.pi)
+            # equivalent to `rng.uniform(0, 2 * math.pi)`, without the wrapper call
+            angle = 2 * math.pi * rand()
             prey_actions.append(angle)
 
         return prey_actions
 
     def get_obs(self, state: PPState) -> Dict[str, PPObs]:
-        return {i: self._get_local_obs(i, state) for i in self.possible_agents}
+        # Sensor rays of all predators are checked together, rather than separately
+        # for each predator (see `_get_local_obs`), with all ray arrays having shape
+        # (num_predators * n_sensors, 2)
+        n, k = self.num_predators, self.n_sensors
+        pred_coords = state.predator_states[:, :2]
+        ray_angles = self._sensor_angles[None, :] + state.predator_states[:, 2, None]
+        ray_starts = np.repeat(pred_coords, k, axis=0)
+        ray_ends = np.stack(
+            [
+                pred_coords[:, 0, None] + self.obs_dist * np.cos(ray_angles),
+                pred_coords[:, 1, None] + self.obs_dist * np.sin(ray_angles),
+            ],
+            axis=2,
+        ).reshape(n * k, 2)
+
+        prey_coords = state.prey_states[~state.prey_caught, :2]
+        prey_obs, _ = self.world.check_ray_collisions(
+            ray_starts,
+            ray_ends,
+            self.obs_dist,
+            other_agents=prey_coords,
+            include_blocks=False,
+            check_walls=False,
+        )
+
+        # each predator's rays should only collide with the other predators
+        # shape = (num_predators, num_predators, n_sensors)
+        dists = self.world.check_circle_line_intersection(
+            pred_coords, self._pred_radii, ray_starts, ray_ends
+        ).reshape(n, n, k)
+        dists[self._pred_idx, self._pred_idx] = np.nan
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            min_dists = np.nanmin(dists, axis=0)
+        pred_obs = np.full(n * k, self.obs_dist, dtype=np.float32)
+        np.fmin(pred_obs, min_dists.reshape(n * k), out=pred_obs)
+
+        obstacle_obs, _ = self.world.check_ray_collisions(
+            ray_starts,
+            ray_ends,
+            self.obs_dist,
+            other_agents=None,
+            include_blocks=True,
+            check_walls=True,
+        )
+
+        # closest of (obstacle, predator, prey) for each sensor of each predator
+        sensor_readings = np.stack([obstacle_obs, pred_obs, prey_obs]).reshape(3, n, k)
+        min_idx = np.argmin(sensor_readings, axis=0)
+        min_val = sensor_readings.min(axis=0)
+        obs = np.full((n, self.obs_dim), self.obs_dist, dtype=np.float32)
+        np.put_along_axis(
+            obs,
+            min_idx * k + self._sensor_idx,
+            np.minimum(min_val, self.obs_dist),
+            axis=1,
+        )
+        return dict(zip(self.possible_agents, obs))
 
     def _get_local_obs(self, agent_id: str, state: PPState) -> np.ndarray:
         state_i = state.predator_states[int(agent_id)]
         pos_i = (state_i[0], state_i[1], state_i[2])
 
-        prey_coords = state.prey_states[state.prey_caught == 0, :2]
+        prey_coords = state.prey_states[~state.prey_caught, :2]
         prey_obs, _ = self.world.check_collision_circular_rays(
             pos_i,
             self.obs_dist,
@@ -693,41 +757,70 @@ class PredatorPreyContinuousModel(M.POSGModel[PPState, PPObs, PPAction]):
         )
 
         obs = np.full((self.obs_dim,), self.obs_dist, dtype=np.float32)
+        # closest of (obstacle, predator, prey) for each sensor
         sensor_readings = np.vstack([obstacle_obs, pred_obs, prey_obs])
         min_idx = np.argmin(sensor_readings, axis=0)
-        min_val = np.take_along_axis(
-            sensor_readings, np.expand_dims(min_idx, axis=0), axis=0
-        ).flatten()
-        idx = np.ravel_multi_index(
-            (min_idx, np.arange(self.n_sensors)), dims=sensor_readings.shape
-        )
+        min_val = sensor_readings.min(axis=0)
+        idx = min_idx * self.n_sensors + self._sensor_idx
         obs[idx] = np.minimum(min_val, obs[idx])
 
         return obs
 
-    def _get_rewards(self, state: PPState, next_state: PPState) -> Dict[str, float]:
-        new_caught_prey = []
-        for i in range(self.num_prey):
-            if not state.prey_caught[i] and next_state.prey_caught[i]:
-                new_caught_prey.append(state.prey_states[i])
-
+    def _get_rewards(
+        self, state: PPState, next_state: PPState, pred_dists_sq: np.ndarray
+    ) -> Dict[str, float]:
+        new_caught_prey = np.flatnonzero(~state.prey_caught & next_state.prey_caught)
         if len(new_caught_prey) == 0:
-            return {i: 0.0 for i in self.possible_agents}
+            return dict.fromkeys(self.possible_agents, 0.0)
 
         if self.cooperative:
             reward = len(new_caught_prey) * (self.per_prey_reward)
-            return {i: reward for i in self.possible_agents}
+            return dict.fromkeys(self.possible_agents, reward)
+
+        # reward for each caught prey is split between the predators involved in its
+        # capture. Uses same distances as capture check, so there is always at least
+        # one involved predator, shape=(len(new_caught_prey), num_predators)
+        involved = pred_dists_sq[new_caught_prey] <= self._prey_capture_dist_sq
+        predator_rewards = self.per_prey_reward / involved.sum(axis=1)
+        rewards = (involved * predator_rewards[:, None]).sum(axis=0)
+        return dict(zip(self.possible_agents, rewards.tolist()))
 
-        rewards = {i: 0.0 for i in self.possible_agents}
-        pred_states = next_state.predator_states
-        for prey_state in new_caught_prey:
-            pred_dists = np.linalg.norm(prey_state[:2] - pred_states[:, :2], axis=1)
-            involved_predators = np.where(pred_dists <= self.prey_capture_dist)[0]
-            predator_reward = self.per_prey_reward / len(involved_predators)
-            for i in involved_predators:
-                rewards[str(i)] += predator_reward
 
-        return rewards
+def _argmin_random_tie(
+    values: List[float], max_value: float, rand: Callable[[], float]
+) -> int:
+    """Get index of the minimum value that is no greater than `max_value`.
+
+    Ties are broken uniformly at random using reservoir sampling, so only a single
+    pass over `values` is needed and `rand` (a uniform [0, 1) sampler) is only called
+    when there is a tie. Returns -1 if all values are greater than `max_value`.
+    """
+    idx, best, n_best = -1, max_value, 0
+    for j, v in enumerate(values):
+        if v > best:
+            continue
+        if v < best or n_best == 0:
+            idx, best, n_best = j, v, 1
+        else:
+            n_best += 1
+            if rand() * n_best < 1.0:
+                idx = j
+    return idx
+
+
+def _pairwise_diffs(a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Get float32 offsets and squared distances from each point in `b` to each in `a`.
+
+    Points in `a` and `b` are copied into contiguous (N, 2) float32 arrays first, so
+    column views of the (N, 6) body state arrays can be passed directly.
+
+    Returns offsets `a[i] - b[j]` with shape `(len(a), len(b), 2)` and squared
+    distances with shape `(len(a), len(b))`.
+    """
+    a = np.ascontiguousarray(a, dtype=np.float32)
+    b = np.ascontiguousarray(b, dtype=np.float32)
+    diffs = a[:, None, :] - b[None, :, :]
+    return diffs, np.einsum("ijk,ijk->ij", diffs, diffs)
 
 
 class PPWorld(SquareContinuousWorld):
@@ -750,49 +843,57 @@ class PPWorld(SquareContinuousWorld):
             enable_agent_collisions=True,
         )
 
+        # block centers and radii, shape = (n_blocks, 2) and (n_blocks,)
+        self._blocks_xy = np.array(
+            [pos[:2] for pos, _ in self.blocks], dtype=np.float64
+        ).reshape(-1, 2)
+        self._blocks_r = np.array(
+            [radius for _, radius in self.blocks], dtype=np.float64
+        )
+
         if predator_start_positions is None:
+            # predators start in corners and middle of edges, not overlapping a block
+            mid, end = size // 2, size - 1
             predator_start_positions = []
-            for col, row in product([0, size // 2, size - 1], repeat=2):
-                if col not in (0, size - 1) and row not in (0, size - 1):
-                    continue
+            for col, row in [
+                (0, 0),
+                (0, mid),
+                (0, end),
+                (mid, 0),
+                (mid, end),
+                (end, 0),
+                (end, mid),
+                (end, end),
+            ]:
                 x, y = col + self.agent_radius, row + self.agent_radius
-                invalid_pos = False
-                for block_pos, block_size in self.blocks:
-                    dist = self.euclidean_dist((x, y, 0.0), block_pos)
-                    if dist <= self.agent_radius + block_size:
-                        invalid_pos = True
-                        break
-                if not invalid_pos:
+                if not self.any_block_overlaps(x, y, self.agent_radius):
                     predator_start_positions.append((x, y, 0.0))
 
-        self.predator_start_positions = predator_start_positions
-
         if prey_start_positions is None:
-            # prey can start anywhere at least distance 2 * self.agent size away from
-            # any predator (i.e. an agent wide gap from any predator)
-            # Not very efficient, but only needs to be run once at the start
-            prey_start_positions = []
-            for col, row in product(range(size), range(size)):
-                if col in (0, size - 1) or row in (0, size - 1):
-                    continue
-                x, y = col + self.agent_radius, row + self.agent_radius
-                invalid_pos = False
-                for pred_pos in self.predator_start_positions:
-                    dist = self.euclidean_dist((x, y), pred_pos)
-                    if dist < 2 * self.agent_radius:
-                        invalid_pos = True
-                        break
-                if invalid_pos:
-                    continue
-                for block_pos, block_size in self.blocks:
-                    dist = self.euclidean_dist((x, y), block_pos)
-                    if dist < self.agent_radius + block_size:
-                        invalid_pos = True
-                        break
-                if not invalid_pos:
-                    prey_start_positions.append((x, y, 0.0))
-
-        self.prey_start_positions = prey_start_positions
+            preds_xy = np.array(
+                [pos[:2] for pos in predator_start_positions], dtype=np.float64
+            ).reshape(-1, 2)
+            xy = _scan_valid_cells(
+                size, self.agent_radius, self._blocks_xy, self._blocks_r, preds_xy
+            )
+            prey_start_positions = [(x, y, 0.0) for x, y in xy.tolist()]
+
+        # (x, y, angle) start positions, shape = (n_positions, 3)
+        self.predator_start_positions = np.array(
+            predator_start_positions, dtype=np.float32
+        ).reshape(-1, 3)
+        self.prey_start_positions = np.array(
+            prey_start_positions, dtype=np.float32
+        ).reshape(-1, 3)
+
+    def get_block_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        # blocks are fixed, so use arrays computed on initialization
+        return self._blocks_xy, self._blocks_r
+
+    def any_block_overlaps(self, x: float, y: float, radius: float) -> bool:
+        """Check if circle with given center and radius overlaps (or touches) a block."""
+        dists_sq = ((self._blocks_xy - (x, y)) ** 2).sum(axis=1)
+        return bool((dists_sq <= (radius + self._blocks_r) ** 2).any())
 
     def copy(self) -> "PPWorld":
         world = PPWorld(
@@ -812,6 +913,33 @@ class PPWorld(SquareContinuousWorld):
         return world
 
 
+def _scan_valid_cells(
+    size: int,
+    agent_radius: float,
+    blocks_xy: np.ndarray,
+    blocks_r: np.ndarray,
+    preds_xy: np.ndarray,
+) -> np.ndarray:
+    """Get valid prey start positions in world with given size.
+
+    Prey can start in any interior cell that doesn't overlap a block and is at least
+    distance 2 * `agent_radius` away from any predator start position (i.e. an agent
+    wide gap from any predator).
+
+    Returns (x, y) of valid cells, ordered by column then row, with shape `(n, 2)`.
+    """
+    cols, rows = np.meshgrid(
+        np.arange(1, size - 1), np.arange(1, size - 1), indexing="ij"
+    )
+    xy = np.stack([cols.ravel(), rows.ravel()], axis=1) + agent_radius
+    pred_dists_sq = ((xy[:, None, :] - preds_xy[None, :, :]) ** 2).sum(axis=2)
+    block_dists_sq = ((xy[:, None, :] - blocks_xy[None, :, :]) ** 2).sum(axis=2)
+    valid = ~(pred_dists_sq < (2 * agent_radius) ** 2).any(axis=1) & ~(
+        block_dists_sq < (agent_radius + blocks_r) ** 2
+    ).any(axis=1)
+    return xy[valid]
+
+
 def parse_world_str(world_str: str) -> PPWorld:
     """Parse a str representation of a world into a world object.
 
@@ -854,7 +982,17 @@ def parse_world_str(world_str: str) -> PPWorld:
     ..........
     P....P...P
 
+    Parsed worlds are cached, so each distinct world str is only parsed (and has its
+    start positions computed) once, and a fresh copy of the cached world is returned
+    each time.
+
     """
+    return _parse_cached_world_str(world_str).copy()
+
+
+@lru_cache(maxsize=128)
+def _parse_cached_world_str(world_str: str) -> PPWorld:
+    # cached worlds must never be modified (e.g. by adding entities), only copied
     row_strs = world_str.splitlines()
     assert len(row_strs) > 1
     assert all(len(row) == len(row_strs[0]) for row in row_strs)
@@ -862,31 +1000,29 @@ def parse_world_str(world_str: str) -> PPWorld:
     assert len(row_strs) == len(row_strs[0])
 
     size = len(row_strs)
-    blocks: Set[CircleEntity] = set()
-    predator_coords = set()
-    prey_coords = set()
-    for r, c in product(range(size), repeat=2):
-        # This is offset to the center of the square
-        pos = (c + 0.5, r + 0.5, 0)
-        char = row_strs[r][c]
-
-        if char == "#":
-            # Radius is 0.5
-            blocks.add((pos, 0.5))
-        elif char == "P":
-            predator_coords.add(pos)
-        elif char == "p":
-            prey_coords.add(pos)
-        else:
-            assert char == "."
+    grid = np.array([list(row) for row in row_strs])
+    assert np.isin(grid, list(".#Pp")).all()
+
+    # (x, y, angle) position of each cell containing each char, offset to the center
+    # of the square, ordered by row then column
+    positions: Dict[str, List[Position]] = {}
+    for char in "#Pp":
+        rows, cols = np.nonzero(grid == char)
+        positions[char] = [
+            (c + 0.5, r + 0.5, 0) for r, c in zip(rows.tolist(), cols.tolist())
+        ]
+
+    # Radius is 0.5
+    # each cell is visited once, so there are no duplicates and no need for sets
+    blocks: List[CircleEntity] = [(pos, 0.5) for pos in positions["#"]]
+    predator_coords = positions["P"]
+    prey_coords = positions["p"]
 
     return PPWorld(
         size,
-        blocks=list(blocks),
-        predator_start_positions=(
-            None if len(predator_coords) == 0 else list(predator_coords)
-        ),
-        prey_start_positions=None if len(prey_coords) == 0 else list(prey_coords),
+        blocks=blocks,
+        predator_start_positions=None if len(predator_coords) == 0 else predator_coords,
+        prey_start_positions=None if len(prey_coords) == 0 else prey_coords,
     )
 
 
@@ -902,15 +1038,23 @@ def get_default_world(size: int, include_blocks: bool) -> PPWorld:
     .....
 
     Where `#` are the blocks, which will be represented as a single circle.
+
+    Worlds are cached, so start positions are only computed the first time a world is
+    requested, and a fresh copy of the cached world is returned each time.
     """
+    return _get_cached_default_world(size, include_blocks).copy()
+
+
+@lru_cache(maxsize=None)
+def _get_cached_default_world(size: int, include_blocks: bool) -> PPWorld:
+    # cached worlds must never be modified (e.g. by adding entities), only copied
+    if not include_blocks:
+        return PPWorld(size=size, blocks=[])
+
+    # block centers are at the same two (x or y) coords, so compute them once
     r = float(size / 10)
-    if include_blocks:
-        blocks = [
-            ((x + r, y + r, 0.0), r)
-            for x, y in product([size / 5, 3 * size / 5], repeat=2)
-        ]
-    else:
-        blocks = []
+    lo, hi = size / 5 + r, 3 * size / 5 + r
+    blocks = [((x, y, 0.0), r) for x, y in [(lo, lo), (lo, hi), (hi, lo), (hi, hi)]]
     return PPWorld(size=size, blocks=blocks)
 
 
@@ -1,4 +1,5 @@
 """Module for posggym vector utils."""
+from posggym.vector.async_vector_env import AsyncVectorEnv
 from posggym.vector.sync_vector_env import SyncVectorEnv
 
-__all__ = ["SyncVectorEnv"]
+__all__ = ["AsyncVectorEnv", "SyncVectorEnv"]
@@ -0,0 +1,285 @@
+"""Asynchronous vectorized environment class.
+
+Based on Gymnasium Vectorized Environments:
+https://github.com/Farama-Foundation/Gymnasium/blob/main/gymnasium/vector/async_vector_env.py
+
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import sys
+import traceback
+from copy import deepcopy
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from gymnasium.vector.utils import concatenate
+
+import posggym
+from posggym.vector.sync_vector_env import SyncVectorEnv
+
+
+class AsyncVectorEnv(SyncVectorEnv):
+    """Vectorized environment that runs multiple environments in parallel.
+
+    Each sub-environment is run in its own worker process, so environments are stepped
+    in parallel, making use of multiple CPU cores. This is most useful when stepping
+    each environment is expensive (e.g. for physics based environments), otherwise the
+    communication overhead between processes can outweigh the benefit.
+
+    Has the same interface and autoreset behaviour as :class:`SyncVectorEnv`, see it
+    for more details.
+
+    """
+
+    def __init__(
+        self,
+        env_fns: Iterable[Callable[[], posggym.Env]],
+        copy: bool = True,
+        context: str | None = None,
+    ):
+        """Initialize the vectorized environment.
+
+        Arguments
+        ---------
+        env_fns
+            iterable of callable functions that create the environments.
+        copy
+            If ``True``, then the :meth:`reset` and :meth:`step` methods return a
+            copy of the observations.
+        context
+            Context for multiprocessing (e.g. "fork", "spawn", "forkserver"). If
+            ``None`` then the default context for the platform is used. Note, with
+            "spawn" and "forkserver" the `env_fns` must be picklable.
+
+        """
+        env_fns = list(env_fns)
+        # create a dummy environment to get the spaces, metadata, etc, and then close it
+        # so its resources are freed.
+        dummy_env = env_fns[0]()
+        self.metadata = dummy_env.metadata
+        self.model = dummy_env.model
+        self._possible_agents = dummy_env.possible_agents
+        self.single_observation_spaces = dummy_env.observation_spaces
+        self.single_action_spaces = dummy_env.action_spaces
+        dummy_env.close()
+        del dummy_env
+
+        ctx = mp.get_context(context)
+        self.parent_pipes: List[Connection] = []
+        self.processes = []
+        for idx, env_fn in enumerate(env_fns):
+            parent_pipe, child_pipe = ctx.Pipe()
+            process = ctx.Process(
+                target=_worker,
+                name=f"Worker<{type(self).__name__}>-{idx}",
+                args=(env_fn, child_pipe, parent_pipe),
+                daemon=True,
+            )
+            self.parent_pipes.append(parent_pipe)
+            self.processes.append(process)
+            process.start()
+            child_pipe.close()
+
+        self.env_fns = env_fns
+        # sub-environments only exist in the worker processes
+        self.envs = []
+        self.copy = copy
+        self.is_vector_env = True
+        self.num_envs = len(env_fns)
+        self.closed = False
+        self._setup_batch()
+
+    def reset(
+        self,
+        *,
+        seed: int | None | List[int] = None,
+        options: Dict[str, Any] | None = None,
+    ):
+        """Reset all environments and return batch of initial observations and info."""
+        if seed is None:
+            seed = [None for _ in range(self.num_envs)]
+        elif isinstance(seed, int):
+            seed = [seed + i for i in range(self.num_envs)]
+        assert len(seed) == self.num_envs
+
+        self._all_dones[:] = False
+        for i in self.single_observation_spaces:
+            self._terminateds[i][:] = False
+            self._truncateds[i][:] = False
+
+        for pipe, s in zip(self.parent_pipes, seed):
+            pipe.send(("reset", {"seed": s, "options": options}))
+        results = self._receive_all()
+
+        observations = {i: [] for i in self.single_observation_spaces}
+        infos = {i: {} for i in self.single_observation_spaces}
+        for env_num, (obs, info) in enumerate(results):
+            for i in self.single_observation_spaces:
+                observations[i].append(obs[i])
+                infos[i] = self._add_info(infos[i], info[i], env_num)
+
+        for i in self.single_observation_spaces:
+            self.observations[i] = concatenate(
+                self.single_observation_spaces[i],
+                observations[i],
+                self.observations[i],
+            )
+
+        return (deepcopy(self.observations) if self.copy else self.observations), infos
+
+    def step(self, actions):
+        """Take a step in all environments with the given actions.
+
+        See :meth:`SyncVectorEnv.step` for details of arguments and return values.
+
+        """
+        for env_num, pipe in enumerate(self.parent_pipes):
+            action = {i: actions[i][env_num] for i in self.single_action_spaces}
+            pipe.send(("step", action))
+        results = self._receive_all()
+
+        observations = {i: [] for i in self.single_observation_spaces}
+        infos = {i: {} for i in self.single_observation_spaces}
+        for env_num, result in enumerate(results):
+            observation, rewards, terminateds, truncateds, all_done, info = result
+            for i in self.single_observation_spaces:
+                observations[i].append(observation[i])
+                infos[i] = self._add_info(infos[i], info[i], env_num)
+                self._rewards[i][env_num] = rewards[i]
+                self._terminateds[i][env_num] = terminateds[i]
+                self._truncateds[i][env_num] = truncateds[i]
+
+            self._all_dones[env_num] = all_done
+
+        for i in self.single_observation_spaces:
+            self.observations[i] = concatenate(
+                self.single_observation_spaces[i],
+                observations[i],
+                self.observations[i],
+            )
+
+        return (
+            (deepcopy(self.observations) if self.copy else self.observations),
+            deepcopy(self._rewards) if self.copy else self._rewards,
+            deepcopy(self._terminateds) if self.copy else self._terminateds,
+            deepcopy(self._truncateds) if self.copy else self._truncateds,
+            deepcopy(self._all_dones) if self.copy else self._all_dones,
+            infos,
+        )
+
+    def close(self):
+        """Close all environments and shutdown worker processes."""
+        if self.closed:
+            return
+        self.closed = True
+        for pipe in self.parent_pipes:
+            try:
+                pipe.send(("close", None))
+                pipe.recv()
+            except (OSError, EOFError):
+                # worker has already exited, e.g. due to an error
+                pass
+            pipe.close()
+        for process in self.processes:
+            process.join()
+
+    def call(self, name: str, *args, **kwargs) -> Tuple:
+        """Call a method on all environments and return the results."""
+        for pipe in self.parent_pipes:
+            pipe.send(("call", (name, args, kwargs)))
+        return tuple(self._receive_all())
+
+    @property
+    def possible_agents(self) -> Tuple[str, ...]:
+        return self._possible_agents
+
+    def _receive_all(self) -> List[Any]:
+        results, successes = zip(*[pipe.recv() for pipe in self.parent_pipes])
+        if not all(successes):
+            errors = [
+                (idx, result)
+                for idx, (result, success) in enumerate(zip(results, successes))
+                if not success
+            ]
+            self.close()
+            idx, (exc_type, msg, tb) = errors[0]
+            raise exc_type(
+                f"Received the following error from Worker-{idx}: "
+                f"{exc_type.__name__}: {msg}\n{tb}"
+            )
+        return list(results)
+
+    def _check_spaces(self) -> bool:
+        observation_spaces = self.call("observation_spaces")
+        action_spaces = self.call("action_spaces")
+        for obs_spaces, act_spaces in zip(observation_spaces, action_spaces):
+            for i in self.single_observation_spaces:
+                if obs_spaces.get(i) != self.single_observation_spaces[i]:
+                    raise RuntimeError(
+                        "Some environments have an observation space different from "
+                        f"`{self.single_observation_spaces[i]}`. In order to batch "
+                        "observations, the observation spaces from all environments "
+                        "must be equal."
+                    )
+                if act_spaces.get(i) != self.single_action_spaces[i]:
+                    raise RuntimeError(
+                        "Some environments have an action space different from "
+                        f"`{self.single_action_spaces[i]}`. In order to batch actions, "
+                        "the action spaces from all environments must be equal."
+                    )
+        return True
+
+    def __del__(self):
+        if not getattr(self, "closed", True):
+            self.close()
+
+
+def _worker(
+    env_fn: Callable[[], posggym.Env], pipe: Connection, parent_pipe: Connection
+):
+    """Run a single environment in a worker process, handling commands from pipe."""
+    parent_pipe.close()
+    env = env_fn()
+    try:
+        while True:
+            command, data = pipe.recv()
+            if command == "reset":
+                pipe.send((env.reset(**data), True))
+            elif command == "step":
+                observation, rewards, terminateds, truncateds, all_done, info = (
+                    env.step(data)
+                )
+                if all_done:
+                    old_observation, old_info = observation, info
+                    observation, info = env.reset()
+                    for i in old_observation:
+                        info[i]["final_observation"] = old_observation[i]
+                        info[i]["final_info"] = old_info[i]
+                pipe.send(
+                    (
+                        (observation, rewards, terminateds, truncateds, all_done, info),
+                        True,
+                    )
+                )
+            elif command == "call":
+                name, args, kwargs = data
+                function = getattr(env, name)
+                if callable(function):
+                    pipe.send((function(*args, **kwargs), True))
+                else:
+                    pipe.send((function, True))
+            elif command == "close":
+                pipe.send((None, True))
+                break
+            else:
+                raise RuntimeError(
+                    f"Received unknown command `{command}`. Must be one of "
+                    "{`reset`, `step`, `call`, `close`}."
+                )
+    except (KeyboardInterrupt, Exception):
+        exc_type, value, _ = sys.exc_info()
+        pipe.send(((exc_type, str(value), traceback.format_exc()), False))
+    finally:
+        env.close()
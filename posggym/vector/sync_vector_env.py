@@ -81,7 +81,10 @@ class SyncVectorEnv(posggym.Env):
 
         self.single_observation_spaces = self.envs[0].observation_spaces
         self.single_action_spaces = self.envs[0].action_spaces
+        self._setup_batch()
 
+    def _setup_batch(self):
+        """Setup batched spaces and buffers for batched step outputs."""
         self._observation_spaces = {
             i: batch_space(self.single_observation_spaces[i], n=self.num_envs)
             for i in self.single_observation_spaces
@@ -1,8 +1,15 @@
 """Specific tests for the DroneTeamCapture-v0 environment."""
 
+from typing import cast
+
+import numpy as np
 import pytest
 
 import posggym
+from posggym.envs.continuous.drone_team_capture import (
+    DroneTeamCaptureModel,
+    DTCState,
+)
 
 
 @pytest.mark.parametrize("num_pursuers", [2, 3, 4, 8])
@@ -36,5 +43,55 @@ def test_init_steps(num_pursuers: int):
     env.close()
 
 
+@pytest.mark.parametrize("observation_limit", [None, 300])
+def test_engagements(observation_limit):
+    """Check vectorized engagement matches engagement between each pair of agents."""
+    env = posggym.make(
+        "DroneTeamCapture-v0", num_agents=8, observation_limit=observation_limit
+    )
+    env.reset(seed=35)
+    model = cast(DroneTeamCaptureModel, env.model)
+    dist_norm_factor = 2 * model.r_arena
+
+    for _ in range(20):
+        state = cast(DTCState, env.state)
+        alphas, dists, visible = model._engagements(
+            state.pursuer_states, state.pursuer_states, dist_norm_factor
+        )
+        for i in range(model.n_pursuers):
+            for j in range(model.n_pursuers):
+                (alpha, dist), vis = model._engagement(
+                    state.pursuer_states[i], state.pursuer_states[j], dist_norm_factor
+                )
+                assert vis == visible[i, j]
+                assert np.isclose(dist, dists[i, j], atol=1e-5)
+                if i != j:
+                    assert np.isclose(alpha, alphas[i, j], atol=1e-5)
+
+        env.step({i: env.action_spaces[i].sample() for i in env.agents})
+
+    env.close()
+
+
+def test_render_every_k():
+    """Check frames are only redrawn every k steps."""
+    env = posggym.make("DroneTeamCapture-v0", render_mode="rgb_array", render_every_k=2)
+    env.reset(seed=35)
+
+    frames = [env.render()]
+    for _ in range(2):
+        env.step({i: env.action_spaces[i].sample() for i in env.agents})
+        frames.append(env.render())
+
+    assert frames[0].shape == (600, 600, 3)
+    assert np.array_equal(frames[0], frames[1])
+    assert not np.array_equal(frames[1], frames[2])
+
+    # reset always redraws
+    env.reset(seed=36)
+    assert not np.array_equal(frames[2], env.render())
+    env.close()
+
+
 if __name__ == "__main__":
     test_init_steps(3)
@@ -1,4 +1,5 @@
 """Specific tests for the PredatorPreyContinuous environment."""
+
 from typing import cast
 
 import numpy as np
@@ -8,6 +9,7 @@ from posggym.envs.continuous.predator_prey_continuous import (
     SUPPORTED_WORLDS,
     PPState,
     PredatorPreyContinuousModel,
+    parse_world_str,
 )
 
 
@@ -51,6 +53,33 @@ def test_obs():
     ).all()
 
 
+def test_batched_obs():
+    """Check observations for all predators match observation of each predator."""
+    env = posggym.make(
+        "PredatorPreyContinuous-v0",
+        world="10x10Blocks",
+        num_predators=4,
+        num_prey=3,
+        prey_strength=2,
+    )
+    env.reset(seed=35)
+    model = cast(PredatorPreyContinuousModel, env.model)
+
+    for _ in range(20):
+        state = cast(PPState, env.state)
+        obs = model.get_obs(state)
+        for i in model.possible_agents:
+            expected_obs = model._get_local_obs(i, state)
+            assert np.allclose(obs[i], expected_obs)
+
+        a = {i: env.action_spaces[i].sample() for i in env.agents}
+        _, _, _, _, all_done, _ = env.step(a)
+        if all_done:
+            env.reset()
+
+    env.close()
+
+
 @pytest.mark.parametrize("world", list(SUPPORTED_WORLDS))
 def test_collisions(world):
     """Check no collisions between predators, prey, blocks and world border."""
@@ -110,5 +139,49 @@ def test_collisions(world):
     env.close()
 
 
+def test_cached_worlds_not_shared():
+    """Check envs created with same world each get their own world."""
+    kwargs = {"world": "10x10Blocks", "num_predators": 2, "num_prey": 2}
+    env_a = posggym.make("PredatorPreyContinuous-v0", **kwargs)
+    env_b = posggym.make("PredatorPreyContinuous-v0", **kwargs)
+    world_a = cast(PredatorPreyContinuousModel, env_a.model).world
+    world_b = cast(PredatorPreyContinuousModel, env_b.model).world
+
+    assert world_a is not world_b
+    assert world_a.space is not world_b.space
+    assert len(world_a.entities) == len(world_b.entities) == 4
+    assert world_a.predator_start_positions is not world_b.predator_start_positions
+    assert np.array_equal(
+        world_a.predator_start_positions, world_b.predator_start_positions
+    )
+    assert np.array_equal(world_a.prey_start_positions, world_b.prey_start_positions)
+
+    env_a.close()
+    env_b.close()
+
+    world_str = "P...p\n.....\n..#..\n.....\np...P"
+    world_a, world_b = parse_world_str(world_str), parse_world_str(world_str)
+    assert world_a is not world_b
+    assert world_a.space is not world_b.space
+    assert np.array_equal(
+        world_a.predator_start_positions, [(0.5, 0.5, 0), (4.5, 4.5, 0)]
+    )
+    assert np.array_equal(world_a.prey_start_positions, world_b.prey_start_positions)
+
+
+def test_any_block_overlaps():
+    """Check block overlap check for circles in world with blocks."""
+    # blocks have radius 1 and are centered at (3, 3), (3, 7), (7, 3), (7, 7)
+    world = SUPPORTED_WORLDS["10x10Blocks"]()
+    assert world.any_block_overlaps(3.0, 3.0, 0.4)
+    assert world.any_block_overlaps(4.3, 3.0, 0.4)
+    assert world.any_block_overlaps(7.0, 8.2, 0.4)
+    assert not world.any_block_overlaps(4.5, 3.0, 0.4)
+    assert not world.any_block_overlaps(5.0, 5.0, 0.4)
+
+    world = SUPPORTED_WORLDS["10x10"]()
+    assert not world.any_block_overlaps(3.0, 3.0, 0.4)
+
+
 if __name__ == "__main__":
     test_obs()